@@ -1,5 +1,6 @@
 """Data validation checks."""
 
+import copy
 import inspect
 import operator
 import re
@@ -29,6 +30,34 @@ SeriesCheckObj = Union[pd.Series, Dict[str, pd.Series]]
 DataFrameCheckObj = Union[pd.DataFrame, Dict[str, pd.DataFrame]]
 
 
+def _get_attributes(obj) -> Dict[str, Any]:
+    """Get the attributes set on an object whose classes define __slots__.
+
+    Attributes in the ``__dict__`` of subclasses that don't define
+    ``__slots__`` are also included.
+    """
+    attributes = {}
+    for cls in reversed(type(obj).__mro__):
+        for attr in cls.__dict__.get("__slots__", ()):
+            if hasattr(obj, attr):
+                attributes[attr] = getattr(obj, attr)
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
+
+
+def _deepcopy_attributes(obj, memo):
+    """Deep copy an object by copying its attributes onto a new instance.
+
+    This avoids the generic ``__reduce_ex__`` protocol, which is slow for
+    the many checks and schemas that are copied whenever a schema is modified.
+    """
+    obj_copy = obj.__class__.__new__(obj.__class__)
+    memo[id(obj)] = obj_copy
+    for k, v in _get_attributes(obj).items():
+        setattr(obj_copy, k, copy.deepcopy(v, memo))
+    return obj_copy
+
+
 def register_check_statistics(statistics_args):
     """Decorator to set statistics based on Check method."""
 
@@ -55,6 +84,22 @@ def register_check_statistics(statistics_args):
 class _CheckBase():
     """Check base class."""
 
+    __slots__ = (
+        "_check_fn",
+        "_check_kwargs",
+        "element_wise",
+        "error",
+        "name",
+        "ignore_na",
+        "raise_warning",
+        "n_failure_cases",
+        "groupby",
+        "groups",
+        "failure_cases",
+        "_statistics",
+        "statistics_args",
+    )
+
     def __init__(
             self,
             check_fn: Callable,
@@ -113,7 +158,10 @@ class _CheckBase():
         :param element_wise: Whether or not to apply validator in an
             element-wise fashion. If bool, assumes that all checks should be
             applied to the column element-wise. If list, should be the same
-            number of elements as checks.
+            number of elements as checks. Element-wise checks call ``check_fn``
+            once per element, so avoid constructing constants like
+            ``pd.Timestamp("2015-01-01")`` inside ``check_fn``: prefer a
+            vectorized check like ``Check.ge(pd.Timestamp("2015-01-01"))``.
         :param name: optional name for the check.
         :param error: custom error message if series fails validation
             check.
@@ -344,8 +392,14 @@ class _CheckBase():
                 "Series, a dictionary of Series, or DataFrame" %
                 df_or_series)
 
-        # apply check function to check object
-        check_fn = partial(self._check_fn, **self._check_kwargs)
+        # apply check function to check object. Only wrap the function when
+        # there are kwargs to bind, since element-wise checks call it once per
+        # element.
+        if self._check_kwargs:
+            check_fn = partial(
+                self._check_fn, **self._check_kwargs)  # type: Callable
+        else:
+            check_fn = self._check_fn
 
         if self.element_wise:
             check_result = check_obj.apply(check_fn, axis=1) if \
@@ -392,18 +446,33 @@ class _CheckBase():
 
     def __eq__(self, other):
         are_fn_objects_equal = \
-            self.__dict__["_check_fn"].__code__.co_code == \
-            other.__dict__["_check_fn"].__code__.co_code
+            self._check_fn.__code__.co_code == \
+            other._check_fn.__code__.co_code
 
+        self_attributes = _get_attributes(self)
+        other_attributes = _get_attributes(other)
         are_all_other_check_attributes_equal = (
-            {i: self.__dict__[i] for i in self.__dict__ if i != '_check_fn'} ==
-            {i: other.__dict__[i] for i in other.__dict__ if i != '_check_fn'}
+            {i: self_attributes[i] for i in self_attributes
+             if i != '_check_fn'} ==
+            {i: other_attributes[i] for i in other_attributes
+             if i != '_check_fn'}
         )
 
         return are_fn_objects_equal and are_all_other_check_attributes_equal
 
     def __hash__(self):
-        return hash(self.__dict__["_check_fn"].__code__.co_code)
+        # only hash attributes that are also compared in __eq__, so that
+        # functionally equivalent checks hash to the same value.
+        return hash((
+            self._check_fn.__code__.co_code,
+            self.element_wise,
+            self.ignore_na,
+            self.name,
+            self.error,
+        ))
+
+    def __deepcopy__(self, memo):
+        return _deepcopy_attributes(self, memo)
 
     def __repr__(self):
         name = getattr(
@@ -416,6 +485,8 @@ class _CheckBase():
 class Check(_CheckBase):
     """Check a pandas Series or DataFrame for certain properties."""
 
+    __slots__ = ()
+
     @classmethod
     @register_check_statistics(["min_value"])
     def greater_than(cls, min_value, **kwargs) -> 'Check':
@@ -442,6 +513,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    gt = greater_than
+
     @classmethod
     @register_check_statistics(["min_value"])
     def greater_than_or_equal_to(cls, min_value, **kwargs) -> 'Check':
@@ -468,6 +541,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    ge = greater_than_or_equal_to
+
     @classmethod
     @register_check_statistics(["max_value"])
     def less_than(cls, max_value, **kwargs) -> 'Check':
@@ -494,6 +569,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    lt = less_than
+
     @classmethod
     @register_check_statistics(["max_value"])
     def less_than_or_equal_to(cls, max_value, **kwargs) -> 'Check':
@@ -520,6 +597,8 @@ class Check(_CheckBase):
             **kwargs
         )
 
+    le = less_than_or_equal_to
+
     @classmethod
     @register_check_statistics([
         "min_value", "max_value", "include_min", "include_max"])
@@ -569,6 +648,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    between = in_range
+
     @classmethod
     @register_check_statistics(["value"])
     def equal_to(cls, value, **kwargs) -> 'Check':
@@ -591,6 +672,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    eq = equal_to
+
     @classmethod
     @register_check_statistics(["value"])
     def not_equal_to(cls, value, **kwargs) -> 'Check':
@@ -613,6 +696,8 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    ne = not_equal_to
+
     @classmethod
     @register_check_statistics(["allowed_values"])
     def isin(
@@ -653,6 +738,43 @@ class Check(_CheckBase):
             **kwargs,
         )
 
+    @classmethod
+    @register_check_statistics(["allowed_values"])
+    def isin_exact(
+            cls, allowed_values: Iterable, **kwargs) -> 'Check':
+        """Ensure that the unique values of a series are exactly a set of
+        values.
+
+        :param allowed_values: The set of values that must all occur in the
+            series, and no others. May be any iterable.
+        :param kwargs: key-word arguments passed into the `Check` initializer.
+
+        :returns: :class:`Check` object
+
+        .. note::
+            This check returns a single boolean, so no element-wise failure
+            cases are reported. Unique values are computed with
+            :func:`pandas.Series.unique`, which operates on the integer codes
+            of categorical series.
+        """
+        try:
+            allowed_values = frozenset(allowed_values)
+        except TypeError:
+            raise ValueError(
+                "Argument allowed_values must be iterable. Got %s" %
+                allowed_values)
+
+        def _isin_exact(series: pd.Series) -> bool:
+            """Comparison function for check"""
+            return set(series.unique()) == allowed_values
+
+        return cls(
+            _isin_exact,
+            name=cls.isin_exact.__name__,
+            error="isin_exact(%s)" % set(allowed_values),
+            **kwargs,
+        )
+
     @classmethod
     @register_check_statistics(["forbidden_values"])
     def notin(
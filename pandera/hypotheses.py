@@ -16,6 +16,8 @@ DEFAULT_ALPHA = 0.01
 class Hypothesis(_CheckBase):
     """Special type of :class:`Check` that defines hypothesis tests on data."""
 
+    __slots__ = ("test", "relationship", "samples")
+
     #: Relationships available for built-in hypothesis tests.
     RELATIONSHIPS = {
         "greater_than": (lambda stat, pvalue, alpha=DEFAULT_ALPHA:
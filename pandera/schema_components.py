@@ -1,6 +1,8 @@
 """Components used in pandera schemas."""
 
+import re
 from copy import copy
+from functools import lru_cache
 
 from typing import Union, Optional, Tuple, Any, List, Dict
 
@@ -8,6 +10,7 @@ import numpy as np
 import pandas as pd
 
 from . import errors, dtypes
+from .checks import _get_attributes
 from .dtypes import PandasDtype
 from .schemas import DataFrameSchema, SeriesSchemaBase, CheckList
 
@@ -17,9 +20,45 @@ def _is_valid_multiindex_tuple_str(x: Tuple[Any]) -> bool:
     return isinstance(x, tuple) and all(isinstance(i, str) for i in x)
 
 
+@lru_cache(maxsize=256)
+def _match_regex_columns(
+        pattern: Union[str, Tuple[str, ...]],
+        columns: Tuple[Any, ...]) -> Tuple[bool, ...]:
+    """Match column names against a regex column name pattern.
+
+    Results are cached on the pattern and column names so that validating
+    dataframes with the same columns repeatedly doesn't re-match the pattern.
+
+    :param pattern: regex pattern, or a tuple of patterns for each level of
+        MultiIndex columns.
+    :param columns: column names to match, where MultiIndex column names are
+        tuples.
+    :returns: boolean mask of matching columns. Non-string column names never
+        match.
+    """
+    def _match(regex, name):
+        return isinstance(name, str) and regex.match(name) is not None
+
+    if isinstance(pattern, tuple):
+        regexes = [re.compile(p) for p in pattern]
+        matches = []
+        for column in columns:
+            if isinstance(column, tuple):
+                names = column  # type: Tuple[Any, ...]
+            else:
+                names = (column, )
+            matches.append(all(
+                _match(regex, name) for regex, name in zip(regexes, names)))
+        return tuple(matches)
+    regex = re.compile(pattern)
+    return tuple(_match(regex, column) for column in columns)
+
+
 class Column(SeriesSchemaBase):
     """Validate types and properties of DataFrame columns."""
 
+    __slots__ = ("required", "pandas_dtype", "_regex")
+
     def __init__(
             self,
             pandas_dtype: Union[
@@ -193,25 +232,14 @@ class Column(SeriesSchemaBase):
                     "columns with %d number of levels, found %d level(s)" %
                     (self.name, len(self.name), columns.nlevels)
                 )
-            matches = np.ones(len(columns)).astype(bool)
-            for i, name in enumerate(self.name):
-                matched = pd.Index(
-                    columns.get_level_values(i).str.match(name)
-                ).fillna(False)
-                matches = matches & np.array(matched.tolist())
-            column_keys_to_check = columns[matches]
-        else:
-            if isinstance(columns, pd.MultiIndex):
-                raise IndexError(
-                    "Column regex name %s is a string, expected a dataframe "
-                    "where the index is a pd.Index object, not a "
-                    "pd.MultiIndex object" % (self.name)
-                )
-            column_keys_to_check = columns[
-                # str.match will return nan values when the index value is
-                # not a string.
-                pd.Index(columns.str.match(self.name)).fillna(False).tolist()
-            ]
+        elif isinstance(columns, pd.MultiIndex):
+            raise IndexError(
+                "Column regex name %s is a string, expected a dataframe "
+                "where the index is a pd.Index object, not a "
+                "pd.MultiIndex object" % (self.name)
+            )
+        matches = _match_regex_columns(self.name, tuple(columns))
+        column_keys_to_check = columns[np.array(matches, dtype=bool)]
         if column_keys_to_check.shape[0] == 0:
             raise errors.SchemaError(
                 self, columns,
@@ -232,7 +260,7 @@ class Column(SeriesSchemaBase):
         def _compare_dict(obj):
             return {
                 k: v if k != "_checks" else set(v)
-                for k, v in obj.__dict__.items()
+                for k, v in _get_attributes(obj).items()
             }
         return _compare_dict(self) == _compare_dict(other)
 
@@ -240,6 +268,8 @@ class Column(SeriesSchemaBase):
 class Index(SeriesSchemaBase):
     """Validate types and properties of a DataFrame Index."""
 
+    __slots__ = ()
+
     def __init__(
             self,
             pandas_dtype: Union[
@@ -346,7 +376,7 @@ class Index(SeriesSchemaBase):
         return "<Schema Index: '%s'>" % self._name
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _get_attributes(self) == _get_attributes(other)
 
 
 class MultiIndex(DataFrameSchema):
@@ -357,6 +387,8 @@ class MultiIndex(DataFrameSchema):
     inherit the `__call__` and `validate` methods from DataFrameSchema.
     """
 
+    __slots__ = ("indexes", )
+
     def __init__(
             self,
             indexes: List[Index],
@@ -514,4 +546,4 @@ class MultiIndex(DataFrameSchema):
         return "<Schema MultiIndex: '%s'>" % list(self.columns)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _get_attributes(self) == _get_attributes(other)
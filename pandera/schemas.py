@@ -2,6 +2,7 @@
 
 import json
 import copy
+import sys
 import warnings
 from functools import wraps
 from pathlib import Path
@@ -10,7 +11,7 @@ from typing import Callable, List, Optional, Union, Dict, Any
 import pandas as pd
 
 from . import errors, constants, dtypes
-from .checks import Check
+from .checks import Check, _deepcopy_attributes, _get_attributes
 from .dtypes import PandasDtype
 from .error_formatters import (
     format_generic_error_message, format_vectorized_error_message,
@@ -51,9 +52,30 @@ def _inferred_schema_guard(method):
     return _wrapper
 
 
+def _intern_column_name(column_name):
+    """Intern string column names so that looking up the same names when
+    validating dataframes can short-circuit on identity."""
+    # only exact str objects can be interned
+    # pylint: disable=unidiomatic-typecheck
+    if type(column_name) is str:
+        return sys.intern(column_name)
+    return column_name
+
+
 class DataFrameSchema():
     """A light-weight pandas DataFrame validator."""
 
+    __slots__ = (
+        "columns",
+        "checks",
+        "index",
+        "transformer",
+        "strict",
+        "name",
+        "_coerce",
+        "_IS_INFERRED",
+    )
+
     def __init__(
             self,
             columns: Dict[Any, Any] = None,
@@ -184,10 +206,11 @@ class DataFrameSchema():
                 return column
             return column.set_name(column_name)
 
-        self.columns = {
-            column_name: _set_column_handler(column, column_name)
-            for column_name, column in self.columns.items()
-        }
+        columns = {}
+        for column_name, column in self.columns.items():
+            column_name = _intern_column_name(column_name)
+            columns[column_name] = _set_column_handler(column, column_name)
+        self.columns = columns
 
     @staticmethod
     def _dataframe_to_validate(
@@ -508,13 +531,16 @@ class DataFrameSchema():
     def __eq__(self, other):
         def _compare_dict(obj):
             return {
-                k: v for k, v in obj.__dict__.items()
+                k: v for k, v in _get_attributes(obj).items()
                 if k != "_IS_INFERRED"
             }
         # if _compare_dict(self) != _compare_dict(other):
         #     import ipdb; ipdb.set_trace()
         return _compare_dict(self) == _compare_dict(other)
 
+    def __deepcopy__(self, memo):
+        return _deepcopy_attributes(self, memo)
+
     @_inferred_schema_guard
     def add_columns(self,
                     extra_schema_cols: Dict[str, Any]) -> 'DataFrameSchema':
@@ -600,7 +626,9 @@ class DataFrameSchema():
         # that exist in the rename_dict
         new_schema = copy.deepcopy(self)
         new_columns = {
-            (rename_dict[col_name] if col_name in rename_dict else col_name): col_attrs
+            _intern_column_name(
+                rename_dict[col_name] if col_name in rename_dict else col_name
+            ): col_attrs
             for col_name, col_attrs in self.columns.items()
         }
         
@@ -613,6 +641,16 @@ class DataFrameSchema():
 class SeriesSchemaBase():
     """Base series validator object."""
 
+    __slots__ = (
+        "_pandas_dtype",
+        "_nullable",
+        "_allow_duplicates",
+        "_coerce",
+        "_checks",
+        "_name",
+        "_IS_INFERRED",
+    )
+
     def __init__(
             self,
             pandas_dtype: Union[
@@ -957,12 +995,17 @@ class SeriesSchemaBase():
         return self.validate(check_obj, head, tail, sample, random_state, lazy)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _get_attributes(self) == _get_attributes(other)
+
+    def __deepcopy__(self, memo):
+        return _deepcopy_attributes(self, memo)
 
 
 class SeriesSchema(SeriesSchemaBase):
     """Series validator."""
 
+    __slots__ = ()
+
     @property
     def _allow_groupby(self) -> bool:
         """Whether the schema or schema component allows groupby operations."""
@@ -1041,7 +1084,7 @@ class SeriesSchema(SeriesSchemaBase):
         return self.validate(check_obj, head, tail, sample, random_state, lazy)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _get_attributes(self) == _get_attributes(other)
 
 
 def _pandas_obj_to_validate(
@@ -290,6 +290,37 @@ def test_equality_operators_functional_equivalence():
     assert main_check == same_check
 
 
+@pytest.mark.parametrize("element_wise", [True, False])
+def test_check_kwargs(element_wise):
+    """Test that check_kwargs are passed into the check function."""
+    check = Check(
+        lambda x, lower, upper: (lower <= x) & (x <= upper),
+        element_wise=element_wise,
+        lower=0,
+        upper=10,
+    )
+    assert check(pd.Series([0, 5, 10])).check_passed
+    check_result = check(pd.Series([-1, 5, 11]))
+    assert not check_result.check_passed
+    assert check_result.failure_cases.tolist() == [-1, 11]
+
+
+def test_check_hash():
+    """Test that equal checks have equal hashes, so they can be deduplicated
+    in sets."""
+    check = Check.greater_than(0)
+    assert hash(check) == hash(Check.greater_than(0))
+    assert hash(check) == hash(copy.deepcopy(check))
+    assert {check, Check.greater_than(0), copy.deepcopy(check)} == {check}
+    assert len({check, Check.greater_than(1), Check.less_than(0)}) == 3
+
+    # functionally equivalent checks are equal and have the same hash
+    check_fn = Check(lambda s: s >= 0)
+    same_check_fn = Check(lambda x: x >= 0)
+    assert check_fn == same_check_fn
+    assert hash(check_fn) == hash(same_check_fn)
+
+
 def test_raise_warning_series():
     """Test that checks with raise_warning=True raise a warning."""
     data = pd.Series([-1, -2, -3])
@@ -502,6 +502,47 @@ class TestIsin:
         check_values(series_values, check, {})
 
 
+class TestIsinExact:
+    """Tests for Check.isin_exact"""
+    @staticmethod
+    @pytest.mark.parametrize('args', [
+        (1, ),  # Not Iterable
+        (None, ),  # None should also not be accepted
+    ])
+    def test_argument_check(args):
+        """Test invalid arguments"""
+        with pytest.raises(ValueError):
+            Check.isin_exact(*args)
+
+    @staticmethod
+    @pytest.mark.parametrize('series, allowed', [
+        (pd.Series((1, 2, 2)), (1, 2)),
+        (pd.Series(("b", "a", "b")), {"a", "b"}),
+        (pd.Series(("b", None, "a")), ["a", "b"]),
+        (pd.Series(("b", "a", "b"), dtype="category"), ("a", "b")),
+    ])
+    def test_succeeding(series, allowed):
+        """Run checks which should succeed"""
+        check_result = Check.isin_exact(allowed)(series)
+        assert check_result.check_passed
+        assert check_result.failure_cases is None
+
+    @staticmethod
+    @pytest.mark.parametrize('series, allowed', [
+        (pd.Series((1, 2, 2)), (1, 2, 3)),
+        (pd.Series((1, 2, 3)), (1, 2)),
+        (pd.Series(("b", None, "a")), ["a", "b"]),
+        # unused categories don't count as values of the series
+        (pd.Categorical(("b", "b"), categories=("a", "b")), ("a", "b")),
+    ])
+    def test_failing(series, allowed):
+        """Run checks which should fail"""
+        check = Check.isin_exact(allowed, ignore_na=False)
+        check_result = check(pd.Series(series))
+        assert not check_result.check_passed
+        assert check_result.failure_cases is None
+
+
 class TestNotin:
     """Tests for Check.notin"""
     @staticmethod
@@ -768,3 +809,20 @@ class TestStrLength:
         check_none_failures(
             series_values, Check.str_length(min_len, max_len, ignore_na=False)
         )
+
+
+@pytest.mark.parametrize("alias, check_method, args", [
+    (Check.eq, Check.equal_to, (1,)),
+    (Check.ne, Check.not_equal_to, (1,)),
+    (Check.gt, Check.greater_than, (1,)),
+    (Check.ge, Check.greater_than_or_equal_to, (1,)),
+    (Check.lt, Check.less_than, (1,)),
+    (Check.le, Check.less_than_or_equal_to, (1,)),
+    (Check.between, Check.in_range, (1, 2)),
+])
+def test_check_aliases(alias, check_method, args):
+    """Short-hand aliases build the same vectorized checks."""
+    alias_check = alias(*args)
+    assert alias_check == check_method(*args)
+    assert alias_check.statistics == check_method(*args).statistics
+    assert not alias_check.element_wise
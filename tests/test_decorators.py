@@ -22,9 +22,7 @@ def test_check_function_decorators():
             "b": Column(String,
                         Check(lambda x: x in ["x", "y", "z"],
                               element_wise=True)),
-            "c": Column(DateTime,
-                        Check(lambda x: pd.Timestamp("2018-01-01") <= x,
-                              element_wise=True)),
+            "c": Column(DateTime, Check.ge(pd.Timestamp("2018-01-01"))),
             "d": Column(Float,
                         Check(lambda x: np.isnan(x) or x < 3,
                               element_wise=True),
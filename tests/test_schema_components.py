@@ -10,6 +10,7 @@ from pandera import errors
 from pandera import (
     Column, DataFrameSchema, Index, MultiIndex, Check, DateTime, Float, Int,
     Object, String)
+from pandera.schema_components import _match_regex_columns
 from tests.test_dtypes import TESTABLE_DTYPES
 
 
@@ -359,6 +360,7 @@ def test_column_regex_matching(
             column_schema.get_regex_columns(columns)
     else:
         matched_columns = column_schema.get_regex_columns(columns)
+        # pylint: disable=no-member
         assert expected_matches == matched_columns.tolist()
 
 
@@ -417,6 +419,23 @@ def test_column_regex_non_str_types():
     schema.validate(data)
 
 
+def test_column_regex_matching_cached():
+    """Regex column matching is cached on the pattern and column names."""
+    # pylint: disable=no-value-for-parameter
+    _match_regex_columns.cache_clear()
+    schema = DataFrameSchema({"foo_*": Column(Int, regex=True)})
+    data = pd.DataFrame({"foo_1": [1, 2, 3], "foo_2": [1, 2, 3]})
+    for _ in range(3):
+        schema.validate(data)
+    cache_info = _match_regex_columns.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits > 0
+
+    # a dataframe with different columns is matched again
+    schema.validate(data.assign(foo_3=[1, 2, 3]))
+    assert _match_regex_columns.cache_info().misses == 2
+
+
 @pytest.mark.parametrize("column_key", [1, 100, 0.543])
 def test_non_str_column_name_regex(column_key):
     """Check that Columns with non-str names cannot have regex=True."""
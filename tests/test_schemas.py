@@ -1,6 +1,7 @@
 """Testing creation and manipulation of DataFrameSchema objects."""
 
 import copy
+import sys
 from functools import partial
 
 import numpy as np
@@ -13,6 +14,26 @@ from pandera import (
 from pandera.schemas import SeriesSchemaBase
 from tests.test_dtypes import TESTABLE_DTYPES
 
+# column values shared by test dataframes with many identical int columns
+INT_COLUMN_VALUES = np.arange(10, dtype=np.int64)
+
+# the error string of an isin check depends on the iteration order of its
+# allowed values, so build the check once and key expected errors on it.
+ISIN_ABC_CHECK = Check.isin(["a", "b", "c"])
+
+
+def _replace_column(df, column, values):
+    """Return a copy of ``df`` with one column replaced.
+
+    Unlike ``df.assign``, this doesn't deep copy the other columns. The column
+    is deleted from the shallow copy before being re-added so that the values
+    aren't written into data shared with ``df``.
+    """
+    df_copy = df.copy(deep=False)
+    del df_copy[column]
+    df_copy[column] = values
+    return df_copy
+
 
 def test_dataframe_schema():
     """Tests the Checking of a DataFrame that has a wide variety of types and
@@ -21,24 +42,16 @@ def test_dataframe_schema():
     """
     schema = DataFrameSchema(
         {
-            "a": Column(Int,
-                        Check(lambda x: x > 0, element_wise=True)),
-            "b": Column(Float,
-                        Check(lambda x: 0 <= x <= 10, element_wise=True)),
-            "c": Column(String,
-                        Check(lambda x: set(x) == {"x", "y", "z"})),
+            "a": Column(Int, Check.gt(0)),
+            "b": Column(Float, Check.between(0, 10)),
+            "c": Column(String, Check.isin_exact(["x", "y", "z"])),
             "d": Column(Bool,
                         Check(lambda x: x.mean() > 0.5)),
-            "e": Column(Category,
-                        Check(lambda x: set(x) == {"c1", "c2", "c3"})),
+            "e": Column(Category, Check.isin_exact(["c1", "c2", "c3"])),
             "f": Column(Object,
                         Check(lambda x: x.isin([(1,), (2,), (3,)]))),
-            "g": Column(DateTime,
-                        Check(lambda x: x >= pd.Timestamp("2015-01-01"),
-                              element_wise=True)),
-            "i": Column(Timedelta,
-                        Check(lambda x: x < pd.Timedelta(10, unit="D"),
-                              element_wise=True))
+            "g": Column(DateTime, Check.ge(pd.Timestamp("2015-01-01"))),
+            "i": Column(Timedelta, Check.lt(pd.Timedelta(10, unit="D"))),
         })
     df = pd.DataFrame(
         {
@@ -62,12 +75,16 @@ def test_dataframe_schema():
         schema.validate(df.drop("a", axis=1))
 
     with pytest.raises(errors.SchemaError):
-        schema.validate(df.assign(a=[-1, -2, -1]))
+        schema.validate(
+            _replace_column(df, "a", np.array([-1, -2, -1], dtype=np.int64)))
 
     # checks if 'a' is converted to float, while schema says int, will a schema
     # error be thrown
     with pytest.raises(errors.SchemaError):
-        schema.validate(df.assign(a=[1.7, 2.3, 3.1]))
+        schema.validate(_replace_column(df, "a", np.array([1.7, 2.3, 3.1])))
+
+    # the original dataframe is left untouched
+    assert isinstance(schema.validate(df), pd.DataFrame)
 
 
 def test_dataframe_schema_strict():
@@ -91,7 +108,7 @@ def test_dataframe_schema_strict_regex():
         strict=True,
     )
     df = pd.DataFrame({
-        "foo_%d" % i: range(10) for i in range(5)
+        "foo_%d" % i: INT_COLUMN_VALUES for i in range(5)
     })
 
     assert isinstance(schema.validate(df), pd.DataFrame)
@@ -100,10 +117,24 @@ def test_dataframe_schema_strict_regex():
     # no matches
     with pytest.raises(errors.SchemaError):
         schema.validate(
-            pd.DataFrame({"bar_%d" % i: range(10) for i in range(5)})
+            pd.DataFrame({"bar_%d" % i: INT_COLUMN_VALUES for i in range(5)})
         )
 
 
+def test_dataframe_schema_interns_column_names():
+    """Test that string column names are interned."""
+    # build the column name at runtime so that it's not interned by default
+    column_name = "".join(["col", "_1"])
+    schema = DataFrameSchema({column_name: Column(Int), 1: Column(Int)})
+    schema_column_name, _ = schema.columns
+    assert schema_column_name is sys.intern("col_1")
+    assert schema.columns[schema_column_name].name is schema_column_name
+    assert schema.validate(
+        pd.DataFrame({"col_1": [1, 2, 3], 1: [1, 2, 3]})).shape == (3, 2)
+    renamed_schema = schema.rename_columns({1: "".join(["col", "_2"])})
+    assert list(renamed_schema.columns)[1] is sys.intern("col_2")
+
+
 def test_series_schema():
     """Tests that a SeriesSchema Check behaves as expected for integers and
     strings. Tests error cases for types, duplicates, name errors, and issues
@@ -111,8 +142,7 @@ def test_series_schema():
 
     SeriesSchema("int").validate(pd.Series([1, 2, 3]))
 
-    int_schema = SeriesSchema(
-        Int, Check(lambda x: 0 <= x <= 100, element_wise=True))
+    int_schema = SeriesSchema(Int, Check.between(0, 100))
     assert isinstance(int_schema.validate(
         pd.Series([0, 30, 50, 100])), pd.Series)
 
@@ -124,14 +154,22 @@ def test_series_schema():
     assert isinstance(str_schema.validate(
         pd.Series(["foo", "bar", "baz", np.nan])), pd.Series)
 
-    # error cases
-    for data in [-1, 101, 50.1, "foo"]:
-        with pytest.raises(errors.SchemaError):
-            int_schema.validate(pd.Series([data]))
+    # error cases: out-of-range values fail the check, and non-int values
+    # fail the dtype check
+    with pytest.raises(errors.SchemaErrors) as excinfo:
+        int_schema.validate(pd.Series([-1, 50, 101]), lazy=True)
+    assert set(excinfo.value.schema_errors.failure_case) == {-1, 101}
 
+    with pytest.raises(errors.SchemaError):
+        int_schema.validate(pd.Series([50.1]))
+
+    with pytest.raises(errors.SchemaError):
+        int_schema.validate(pd.Series(["foo"]))
+
+    # only Series objects can be validated
     for data in [-1, {"a": 1}, -1.0]:
         with pytest.raises(TypeError):
-            int_schema.validate(TypeError)
+            int_schema.validate(data)
 
     non_duplicate_schema = SeriesSchema(
         Int, allow_duplicates=False)
@@ -201,6 +239,51 @@ def series_greater_than_ten(series: pd.Series):
     return series > 10
 
 
+def series_greater_or_equal_zero(series: pd.Series):
+    """Return a bool series indicating whether the elements of s are >= 0"""
+    return series >= 0
+
+
+def series_greater_or_equal_two(series: pd.Series):
+    """Return a bool series indicating whether the elements of s are >= 2"""
+    return series >= 2
+
+
+def series_less_or_equal_zero(series: pd.Series):
+    """Return a bool series indicating whether the elements of s are <= 0"""
+    return series <= 0
+
+
+def series_equal_zero(series: pd.Series):
+    """Return a bool series indicating whether the elements of s are == 0"""
+    return series == 0
+
+
+def series_startswith_foo(series: pd.Series):
+    """Return a bool series indicating whether the elements of s start with
+    'foo'"""
+    return series.str.startswith("foo")
+
+
+# pytest fixtures are passed to tests as arguments of the same name
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def int_float_dataframe():
+    """Dataframe with an int and a float column, shared across tests."""
+    return pd.DataFrame({
+        "a": [1, 2, 3],
+        "b": [1.1, 2.5, 9.9]
+    })
+
+
+@pytest.fixture(scope="module")
+def int_float_schema():
+    """Schema template for ``int_float_dataframe`` without any checks."""
+    return DataFrameSchema({"a": Column(Int), "b": Column(Float)})
+
+
 @pytest.mark.parametrize("check_function, should_fail", [
     (lambda s: s > 0, False),
     (lambda s: s > 10, True),
@@ -209,19 +292,15 @@ def series_greater_than_ten(series: pd.Series):
     (SeriesGreaterCheck(lower_bound=0), False),
     (SeriesGreaterCheck(lower_bound=10), True)
 ])
-def test_dataframe_schema_check_function_types(check_function, should_fail):
+def test_dataframe_schema_check_function_types(
+        check_function, should_fail, int_float_dataframe, int_float_schema):
     """Tests a DataFrameSchema against a variety of Check conditions."""
-    schema = DataFrameSchema(
-        {
-            "a": Column(Int,
-                        Check(check_function, element_wise=False)),
-            "b": Column(Float,
-                        Check(check_function, element_wise=False))
-        })
-    df = pd.DataFrame({
-        "a": [1, 2, 3],
-        "b": [1.1, 2.5, 9.9]
-    })
+    schema = (
+        int_float_schema
+        .update_column("a", checks=Check(check_function, element_wise=False))
+        .update_column("b", checks=Check(check_function, element_wise=False))
+    )
+    df = int_float_dataframe
     if should_fail:
         with pytest.raises(errors.SchemaError):
             schema.validate(df)
@@ -267,8 +346,8 @@ def test_coerce_dtype_in_dataframe():
         result = schema.validate(df)
         assert result.column1.dtype == Int.str_alias
         assert result.column2.dtype == DateTime.str_alias
-        for _, x in result.column3.iteritems():
-            assert pd.isna(x) or isinstance(x, str)
+        assert pd.api.types.infer_dtype(
+            result.column3, skipna=True) in ("string", "empty")
 
         # make sure that correct error is raised when null values are present
         # in a float column that's coerced to an int
@@ -287,23 +366,25 @@ def test_coerce_dtype_nullable_str():
         "col": ["foobar", "foo", "bar", "baz", None, None],
     })
 
+    # validate both kinds of null values in one pass
+    df = pd.concat([df_nans, df_nones], ignore_index=True)
+    null_mask = df["col"].isna()
+
     with pytest.raises(errors.SchemaError):
-        for df in [df_nans, df_nones]:
-            DataFrameSchema({
-                "col": Column(String, coerce=True, nullable=False)
-            }).validate(df)
+        DataFrameSchema({
+            "col": Column(String, coerce=True, nullable=False)
+        }).validate(df)
 
     schema = DataFrameSchema({
         "col": Column(String, coerce=True, nullable=True)
     })
 
-    for df in [df_nans, df_nones]:
-        validated_df = schema.validate(df)
-        assert isinstance(validated_df, pd.DataFrame)
-        assert pd.isna(validated_df["col"].iloc[-1])
-        assert pd.isna(validated_df["col"].iloc[-2])
-        for i in range(4):
-            assert isinstance(validated_df["col"].iloc[i], str)
+    validated_df = schema.validate(df)
+    assert isinstance(validated_df, pd.DataFrame)
+    # null values are preserved and all other values are strings
+    assert validated_df["col"].isna().equals(null_mask)
+    assert pd.api.types.infer_dtype(
+        validated_df["col"], skipna=True) == "string"
 
 
 def test_no_dtype_dataframe():
@@ -384,13 +465,22 @@ def test_required():
         schema.validate(df_not_ok)
 
 
-def test_head_dataframe_schema():
+@pytest.fixture(scope="module")
+def head_tail_dataframe():
+    """Dataframe with 100 non-negative values followed by 1000 negative
+    values."""
+    return pd.DataFrame({
+        "col1": np.concatenate([
+            np.arange(0, 100, dtype=np.int64),
+            np.arange(-1, -1001, -1, dtype=np.int64),
+        ])
+    })
+
+
+def test_head_dataframe_schema(head_tail_dataframe):
     """Test that schema can validate head of dataframe, returns entire
     dataframe."""
-
-    df = pd.DataFrame({
-        "col1": list(range(0, 100)) + list(range(-1, -1001, -1))
-    })
+    df = head_tail_dataframe
 
     schema = DataFrameSchema(
         columns={"col1": Column(Int, Check(lambda s: s >= 0))})
@@ -401,11 +491,9 @@ def test_head_dataframe_schema():
         schema.validate(df)
 
 
-def test_tail_dataframe_schema():
+def test_tail_dataframe_schema(head_tail_dataframe):
     """Checks that validating the tail of a dataframe validates correctly."""
-    df = pd.DataFrame({
-        "col1": list(range(0, 100)) + list(range(-1, -1001, -1))
-    })
+    df = head_tail_dataframe
 
     schema = DataFrameSchema(
         columns={"col1": Column(Int, Check(lambda s: s < 0))})
@@ -418,17 +506,20 @@ def test_tail_dataframe_schema():
 
 def test_sample_dataframe_schema():
     """Test the sample argument of schema.validate."""
-    df = pd.DataFrame({
-        "col1": range(1, 1001)
-    })
+    col1 = np.arange(1, 1001, dtype=np.int64)
 
     # assert all values -1
     schema = DataFrameSchema(
         columns={"col1": Column(Int, Check(lambda s: s == -1))})
 
     for seed in [11, 123456, 9000, 654]:
-        sample_index = df.sample(100, random_state=seed).index
-        df.loc[sample_index] = -1
+        # these are the same positions that DataFrame.sample draws with the
+        # same random_state
+        # pylint: disable=no-member
+        sample_positions = np.random.RandomState(seed).choice(
+            col1.shape[0], 100, replace=False)
+        col1[sample_positions] = -1
+        df = pd.DataFrame({"col1": col1})
         assert schema.validate(df, sample=100, random_state=seed).equals(df)
 
 
@@ -480,22 +571,22 @@ def test_schema_equality_operators():
     """Test the usage of == for DataFrameSchema, SeriesSchema and
     SeriesSchemaBase."""
     df_schema = DataFrameSchema({
-        "col1": Column(Int, Check(lambda s: s >= 0)),
-        "col2": Column(String, Check(lambda s: s >= 2)),
+        "col1": Column(Int, Check(series_greater_or_equal_zero)),
+        "col2": Column(String, Check(series_greater_or_equal_two)),
         }, strict=True)
     df_schema_columns_in_different_order = DataFrameSchema({
-        "col2": Column(String, Check(lambda s: s >= 2)),
-        "col1": Column(Int, Check(lambda s: s >= 0)),
+        "col2": Column(String, Check(series_greater_or_equal_two)),
+        "col1": Column(Int, Check(series_greater_or_equal_zero)),
         }, strict=True)
     series_schema = SeriesSchema(
         String,
-        checks=[Check(lambda s: s.str.startswith("foo"))],
+        checks=[Check(series_startswith_foo)],
         nullable=False,
         allow_duplicates=True,
         name="my_series")
     series_schema_base = SeriesSchemaBase(
         String,
-        checks=[Check(lambda s: s.str.startswith("foo"))],
+        checks=[Check(series_startswith_foo)],
         nullable=False,
         allow_duplicates=True,
         name="my_series")
@@ -516,15 +607,15 @@ def test_add_and_remove_columns():
     """Check that adding and removing columns works as expected and doesn't
     modify the original underlying DataFrameSchema."""
     schema1 = DataFrameSchema({
-        "col1": Column(Int, Check(lambda s: s >= 0)),
+        "col1": Column(Int, Check(series_greater_or_equal_zero)),
         }, strict=True)
 
     schema1_exact_copy = copy.deepcopy(schema1)
 
     # test that add_columns doesn't modify schema1 after add_columns:
     schema2 = schema1.add_columns({
-        "col2": Column(String, Check(lambda x: x <= 0)),
-        "col3": Column(Object, Check(lambda x: x == 0))
+        "col2": Column(String, Check(series_less_or_equal_zero)),
+        "col3": Column(Object, Check(series_equal_zero))
         })
 
     schema2_exact_copy = copy.deepcopy(schema2)
@@ -533,9 +624,9 @@ def test_add_and_remove_columns():
 
     # test that add_columns changed schema1 into schema2:
     expected_schema_2 = DataFrameSchema({
-        "col1": Column(Int, Check(lambda s: s >= 0)),
-        "col2": Column(String, Check(lambda x: x <= 0)),
-        "col3": Column(Object, Check(lambda x: x == 0))
+        "col1": Column(Int, Check(series_greater_or_equal_zero)),
+        "col2": Column(String, Check(series_less_or_equal_zero)),
+        "col3": Column(Object, Check(series_equal_zero))
         }, strict=True)
 
     assert schema2 == expected_schema_2
@@ -547,8 +638,8 @@ def test_add_and_remove_columns():
 
     # test that remove_columns has removed the changes as expected:
     expected_schema_3 = DataFrameSchema({
-        "col1": Column(Int, Check(lambda s: s >= 0)),
-        "col3": Column(Object, Check(lambda x: x == 0))
+        "col1": Column(Int, Check(series_greater_or_equal_zero)),
+        "col3": Column(Object, Check(series_equal_zero))
         }, strict=True)
 
     assert schema3 == expected_schema_3
@@ -557,12 +648,53 @@ def test_add_and_remove_columns():
     schema4 = schema2.remove_columns(["col2", "col3"])
 
     expected_schema_4 = DataFrameSchema({
-        "col1": Column(Int, Check(lambda s: s >= 0))
+        "col1": Column(Int, Check(series_greater_or_equal_zero))
         }, strict=True)
 
     assert schema4 == expected_schema_4 == schema1
 
 
+def test_schema_deepcopy():
+    """Test that deep copies of schemas preserve state and share no mutable
+    attributes with the original."""
+    check = Check.greater_than(0, groupby="col2")
+    schema = DataFrameSchema({
+        "col1": Column(Int, check),
+        "col2": Column(String),
+    })
+    schema._is_inferred = True  # pylint: disable=protected-access
+    schema_copy = copy.deepcopy(schema)
+
+    assert schema_copy == schema
+    assert schema_copy._is_inferred  # pylint: disable=protected-access
+    assert schema_copy.columns is not schema.columns
+
+    check_copy = schema_copy.columns["col1"].checks[0]
+    assert check_copy == check
+    assert check_copy is not check
+    assert check_copy.statistics == check.statistics == {"min_value": 0}
+    assert check_copy.groupby is not check.groupby
+
+    schema_copy.columns["col1"].checks.append(Check.less_than(10))
+    assert len(schema.columns["col1"].checks) == 1
+
+
+@pytest.mark.parametrize("obj", [
+    DataFrameSchema({"col": Column(Int)}),
+    SeriesSchema(Int),
+    Column(Int, name="col"),
+    Index(Int),
+    MultiIndex([Index(Int, name="index0"), Index(Int, name="index1")]),
+    Check.greater_than(0),
+])
+def test_schema_objects_use_slots(obj):
+    """Test that schema and check objects store attributes in __slots__."""
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.foobar = 1
+    assert copy.deepcopy(obj) == obj
+
+
 def test_schema_get_dtype():
     """Test that schema dtype and get_dtype methods handle regex columns."""
     schema = DataFrameSchema({
@@ -690,28 +822,24 @@ def test_lazy_dataframe_validation_error():
 
     with pytest.raises(
             errors.SchemaErrors,
-            match="^A total of .+ schema errors were found"):
+            match="^A total of .+ schema errors were found") as excinfo:
         schema.validate(dataframe, lazy=True)
+    err = excinfo.value
 
-    try:
-        schema.validate(dataframe, lazy=True)
-    except errors.SchemaErrors as err:
-
-        # data in the caught exception should be equal to the dataframe
-        # passed into validate
-        assert err.data.equals(dataframe)
-
-        # make sure all expected check errors are in schema errors
-        for schema_context, check_failure_cases in expectation.items():
-            err_df = err.schema_errors.loc[
-                err.schema_errors.schema_context == schema_context]
-            for check, failure_cases in check_failure_cases.items():
-                assert check in err_df.check.values
-                assert (
-                    err_df.loc[err_df.check == check]
-                    .failure_case.isin(failure_cases)
-                    .all()
-                )
+    # data in the caught exception should be equal to the dataframe
+    # passed into validate
+    assert err.data.equals(dataframe)
+
+    # make sure all expected check errors are in schema errors
+    actual_failure_cases = (
+        err.schema_errors.groupby(["schema_context", "check"])
+        .failure_case.agg(set).to_dict()
+    )
+    for schema_context, check_failure_cases in expectation.items():
+        for check, failure_cases in check_failure_cases.items():
+            assert (schema_context, check) in actual_failure_cases
+            assert actual_failure_cases[(schema_context, check)] <= \
+                set(failure_cases)
 
 
 def test_lazy_dataframe_validation_nullable():
@@ -734,17 +862,18 @@ def test_lazy_dataframe_validation_nullable():
         "str_column": [None, "foo", "bar"],
     })
 
-    try:
+    with pytest.raises(errors.SchemaErrors) as excinfo:
         schema.validate(df, lazy=True)
-    except errors.SchemaErrors as err:
-        assert err.schema_errors.failure_case.isna().all()
-        for col, index in [
-                ("int_column", 1),
-                ("float_column", 2),
-                ("str_column", 0)]:
-            # pylint: disable=cell-var-from-loop
-            assert err.schema_errors.loc[
-                lambda df: df.column == col, "index"].iloc[0] == index
+    err = excinfo.value
+
+    assert err.schema_errors.failure_case.isna().all()
+    for col, index in [
+            ("int_column", 1),
+            ("float_column", 2),
+            ("str_column", 0)]:
+        # pylint: disable=cell-var-from-loop
+        assert err.schema_errors.loc[
+            lambda df: df.column == col, "index"].iloc[0] == index
 
 
 @pytest.mark.parametrize("schema_cls, data", [
@@ -804,14 +933,14 @@ def test_lazy_dataframe_scalar_false_check(schema_cls, data):
         },
     ],
     [
-        Index(String, checks=Check.isin(["a", "b", "c"])),
+        Index(String, checks=ISIN_ABC_CHECK),
         pd.DataFrame({"col": [1, 2, 3]}, index=["a", "b", "d"]),
         {
             # expect that the data in the SchemaError is the pd.Index cast
             # into a Series
             "data": pd.Series(["a", "b", "d"]),
             "schema_errors": {
-                "Index": {"isin(%s)" % {'a', 'b', 'c'}: ["d"]},
+                "Index": {ISIN_ABC_CHECK.error: ["d"]},
             }
         },
     ],
@@ -850,23 +979,22 @@ def test_lazy_dataframe_scalar_false_check(schema_cls, data):
 ])
 def test_lazy_series_validation_error(schema, data, expectation):
     """Test exceptions on lazy series validation."""
-    try:
+    with pytest.raises(errors.SchemaErrors) as excinfo:
         schema.validate(data, lazy=True)
-    except errors.SchemaErrors as err:
-        # data in the caught exception should be equal to the data
-        # passed into validate
-        assert err.data.equals(expectation["data"])
-
-        # make sure all expected check errors are in schema errors
-        for schema_context, check_failure_cases in \
-                expectation["schema_errors"].items():
-            assert schema_context in err.schema_errors.schema_context.values
-            err_df = err.schema_errors.loc[
-                err.schema_errors.schema_context == schema_context]
-            for check, failure_cases in check_failure_cases.items():
-                assert check in err_df.check.values
-                assert (
-                    err_df.loc[err_df.check == check]
-                    .failure_case.isin(failure_cases)
-                    .all()
-                )
+    err = excinfo.value
+
+    # data in the caught exception should be equal to the data
+    # passed into validate
+    assert err.data.equals(expectation["data"])
+
+    # make sure all expected check errors are in schema errors
+    actual_failure_cases = (
+        err.schema_errors.groupby(["schema_context", "check"])
+        .failure_case.agg(set).to_dict()
+    )
+    for schema_context, check_failure_cases in \
+            expectation["schema_errors"].items():
+        for check, failure_cases in check_failure_cases.items():
+            assert (schema_context, check) in actual_failure_cases
+            assert actual_failure_cases[(schema_context, check)] <= \
+                set(failure_cases)